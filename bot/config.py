@@ -8,6 +8,12 @@ load_dotenv()
 BOT_TOKEN: str = os.getenv("BOT_TOKEN", "")
 DATABASE_URL: str = os.getenv("DATABASE_URL", "")
 
+# Optional: public HTTPS base URL. When set, the bot receives updates via webhook instead of polling.
+WEBHOOK_URL: str = os.getenv("WEBHOOK_URL", "").rstrip("/")
+WEBHOOK_PATH: str = os.getenv("WEBHOOK_PATH", "telegram")
+WEBHOOK_SECRET: str = os.getenv("WEBHOOK_SECRET", "")
+PORT: int = int(os.getenv("PORT", "8080"))
+
 if not BOT_TOKEN:
     raise RuntimeError(
         "BOT_TOKEN is not set. "
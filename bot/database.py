@@ -10,7 +10,13 @@ _pool: asyncpg.Pool | None = None
 async def init_db(database_url: str) -> None:
     """Create the connection pool and tables."""
     global _pool
-    _pool = await asyncpg.create_pool(database_url, min_size=1, max_size=5)
+    _pool = await asyncpg.create_pool(
+        database_url,
+        min_size=2,
+        max_size=20,
+        # Recycle connections idle for 5 minutes so the pool shrinks after bursts
+        max_inactive_connection_lifetime=300,
+    )
 
     async with _pool.acquire() as conn:
         await conn.execute(
@@ -108,16 +114,29 @@ async def create_party(name: str, code: str, creator_id: int) -> int:
         return row["id"]
 
 
-async def get_party_by_code(code: str) -> dict | None:
-    """Look up a party by its unique invite code."""
+async def get_party_by_id(party_id: int) -> dict | None:
     async with _pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT * FROM parties WHERE code = $1", code)
+        row = await conn.fetchrow("SELECT * FROM parties WHERE id = $1", party_id)
         return _record_to_dict(row)
 
 
-async def get_party_by_id(party_id: int) -> dict | None:
+async def get_party_context(party_id: int, telegram_id: int) -> dict | None:
+    """Return the party row (including info fields) plus the user's membership flags.
+
+    Adds is_member and is_admin columns. Returns None if the party doesn't exist.
+    """
     async with _pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT * FROM parties WHERE id = $1", party_id)
+        row = await conn.fetchrow(
+            """
+            SELECT p.*,
+                   pm.telegram_id IS NOT NULL AS is_member,
+                   COALESCE(pm.is_admin, FALSE) AS is_admin
+            FROM parties p
+            LEFT JOIN party_members pm ON pm.party_id = p.id AND pm.telegram_id = $2
+            WHERE p.id = $1
+            """,
+            party_id, telegram_id,
+        )
         return _record_to_dict(row)
 
 
@@ -126,7 +145,7 @@ async def get_parties_for_user(telegram_id: int) -> list[dict]:
     async with _pool.acquire() as conn:
         rows = await conn.fetch(
             """
-            SELECT p.*, creator_pm.telegram_name AS creator_name
+            SELECT p.id, p.name, p.creator_id, creator_pm.telegram_name AS creator_name
             FROM parties p
             JOIN party_members pm ON p.id = pm.party_id
             LEFT JOIN party_members creator_pm
@@ -188,6 +207,33 @@ async def add_member(party_id: int, telegram_id: int, telegram_name: str, is_adm
             return False
 
 
+async def join_party_by_code(code: str, telegram_id: int, telegram_name: str) -> dict | None:
+    """Look up a party by invite code and add the user to it in one round-trip.
+
+    Returns the party's id, name and creator_id plus newly_joined and is_admin,
+    or None if no party has this code. Existing members get their display name refreshed.
+    """
+    async with _pool.acquire() as conn:
+        row = await conn.fetchrow(
+            """
+            WITH party AS (
+                SELECT id, name, creator_id FROM parties WHERE code = $1
+            ), joined AS (
+                INSERT INTO party_members (party_id, telegram_id, telegram_name, joined_at, is_admin)
+                SELECT id, $2, $3, $4, FALSE FROM party
+                ON CONFLICT (party_id, telegram_id)
+                    DO UPDATE SET telegram_name = EXCLUDED.telegram_name
+                -- xmax is 0 only for freshly inserted rows
+                RETURNING is_admin, (xmax = 0) AS newly_joined
+            )
+            SELECT party.id, party.name, party.creator_id, joined.newly_joined, joined.is_admin
+            FROM party, joined
+            """,
+            code, telegram_id, telegram_name, datetime.now(timezone.utc).isoformat(),
+        )
+        return _record_to_dict(row)
+
+
 async def update_member_name(party_id: int, telegram_id: int, telegram_name: str) -> None:
     """Update a member's display name (keeps it current when usernames change)."""
     async with _pool.acquire() as conn:
@@ -216,8 +262,11 @@ async def get_member(party_id: int, telegram_id: int) -> dict | None:
         return _record_to_dict(row)
 
 
-async def remove_member(party_id: int, telegram_id: int) -> None:
-    """Remove a member and all their fillings and ratings from a party."""
+async def remove_member(party_id: int, telegram_id: int) -> bool:
+    """Remove a member and all their fillings and ratings from a party.
+
+    Returns False if they weren't a member (e.g. a concurrent call already removed them).
+    """
     async with _pool.acquire() as conn:
         async with conn.transaction():
             await conn.execute(
@@ -228,10 +277,11 @@ async def remove_member(party_id: int, telegram_id: int) -> None:
                 "DELETE FROM fillings WHERE party_id = $1 AND added_by_id = $2",
                 party_id, telegram_id,
             )
-            await conn.execute(
+            status = await conn.execute(
                 "DELETE FROM party_members WHERE party_id = $1 AND telegram_id = $2",
                 party_id, telegram_id,
             )
+    return status == "DELETE 1"
 
 
 async def is_user_admin(party_id: int, telegram_id: int) -> bool:
@@ -262,14 +312,18 @@ async def demote_admin(party_id: int, telegram_id: int) -> None:
         )
 
 
-async def delete_party(party_id: int) -> None:
-    """Delete a party and all its members, fillings, and ratings."""
+async def delete_party(party_id: int) -> bool:
+    """Delete a party and all its members, fillings, and ratings.
+
+    Returns False if the party was already gone (e.g. a concurrent call deleted it).
+    """
     async with _pool.acquire() as conn:
         async with conn.transaction():
             await conn.execute("DELETE FROM party_ratings WHERE party_id = $1", party_id)
             await conn.execute("DELETE FROM fillings WHERE party_id = $1", party_id)
             await conn.execute("DELETE FROM party_members WHERE party_id = $1", party_id)
-            await conn.execute("DELETE FROM parties WHERE id = $1", party_id)
+            status = await conn.execute("DELETE FROM parties WHERE id = $1", party_id)
+    return status == "DELETE 1"
 
 
 async def search_members(party_id: int, query: str) -> list[dict]:
@@ -368,6 +422,16 @@ async def get_ratings(party_id: int) -> list[dict]:
         return [dict(r) for r in rows]
 
 
+async def get_ratings_summary(party_id: int) -> tuple[int, float | None]:
+    """Return (count, average) of a party's ratings without fetching the rows."""
+    async with _pool.acquire() as conn:
+        row = await conn.fetchrow(
+            "SELECT COUNT(*) AS count, AVG(rating)::float AS avg FROM party_ratings WHERE party_id = $1",
+            party_id,
+        )
+        return row["count"], row["avg"]
+
+
 async def get_user_rating(party_id: int, telegram_id: int) -> dict | None:
     """Get a single user's rating for a party."""
     async with _pool.acquire() as conn:
@@ -347,6 +347,7 @@ def add_filling_conversation() -> ConversationHandler:
         ],
         per_message=False,
         allow_reentry=True,
+        block=True,
     )
 
 
@@ -365,4 +366,5 @@ def rename_filling_conversation() -> ConversationHandler:
         ],
         per_message=False,
         allow_reentry=True,
+        block=True,
     )
@@ -18,7 +18,7 @@ from bot.keyboards import (
     members_keyboard,
     party_menu_keyboard,
 )
-from bot.utils import esc
+from bot.utils import esc, forget_join
 
 NOT_A_MEMBER_TEXT = "⚠️ You are no longer a member of this party."
 
@@ -133,7 +133,15 @@ async def confirm_kick_callback(update: Update, context: ContextTypes.DEFAULT_TY
     member = await db.get_member(party_id, target_id)
     name = member["telegram_name"] if member else "Unknown"
 
-    await db.remove_member(party_id, target_id)
+    if not await db.remove_member(party_id, target_id):
+        # Already gone — e.g. a concurrent tap removed them — so don't notify them twice
+        await query.edit_message_text(
+            f"<b>{esc(name)}</b> is no longer in the party.",
+            parse_mode="HTML",
+            reply_markup=members_keyboard(party_id),
+        )
+        return
+    forget_join(context.application.user_data.get(target_id))
 
     # Notify the kicked user
     try:
@@ -291,4 +299,5 @@ def search_member_conversation() -> ConversationHandler:
         ],
         per_message=False,
         allow_reentry=True,
+        block=True,
     )
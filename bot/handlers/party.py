@@ -22,7 +22,7 @@ from bot.keyboards import (
     main_menu_keyboard,
     party_menu_keyboard,
 )
-from bot.utils import esc, generate_party_code, user_display_name
+from bot.utils import esc, forget_join, generate_party_code, user_display_name
 
 
 # Conversation states
@@ -249,7 +249,12 @@ async def confirm_cancel_party_callback(update: Update, context: ContextTypes.DE
 
     party_name = party["name"]
     members = await db.get_members(party_id)
-    await db.delete_party(party_id)
+    # A re-tapped invite link must not answer from a join memo of the deleted party
+    for m in members:
+        forget_join(context.application.user_data.get(m["telegram_id"]))
+    if not await db.delete_party(party_id):
+        # A concurrent tap (handlers run non-blocking) already deleted it and notified everyone
+        return
 
     await query.edit_message_text(
         f"🚫 Party <b>{esc(party_name)}</b> has been cancelled and all data deleted.",
@@ -293,6 +298,7 @@ async def confirm_leave_callback(update: Update, context: ContextTypes.DEFAULT_T
         return
 
     await db.remove_member(party_id, user.id)
+    forget_join(context.user_data)
 
     await query.edit_message_text(
         f"👋 You have left <b>{esc(party['name'])}</b>.",
@@ -495,6 +501,7 @@ def invite_contact_conversation() -> ConversationHandler:
         ],
         per_message=False,
         allow_reentry=True,
+        block=True,
     )
 
 
@@ -643,6 +650,7 @@ def broadcast_conversation() -> ConversationHandler:
         ],
         per_message=False,
         allow_reentry=True,
+        block=True,
     )
 
 
@@ -662,4 +670,5 @@ def create_party_conversation() -> ConversationHandler:
         ],
         per_message=False,
         allow_reentry=True,
+        block=True,
     )
@@ -1,9 +1,10 @@
 """Handlers for viewing and editing party info (date, address, map, description)."""
 
-import json
 import logging
 import re
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import (
@@ -23,7 +24,7 @@ from bot.keyboards import (
     party_info_keyboard,
     time_picker_keyboard,
 )
-from bot.utils import esc
+from bot.utils import answer_in_background, esc, send_to_many
 
 logger = logging.getLogger(__name__)
 
@@ -45,50 +46,97 @@ FIELD_PROMPTS = {
 # Calendar ID to namespace callback data
 CALENDAR_ID = 1
 
+# Callback-data patterns, compiled once. Handlers read ids from context.match.
+_FIELD_RE = "|".join(db.INFO_FIELDS)
+SET_INFO_PATTERN = re.compile(rf"^set_info:(\d+):({_FIELD_RE})$")
+CLEAR_INFO_PATTERN = re.compile(rf"^clear_info:(\d+):({_FIELD_RE})$")
+EDIT_INFO_PATTERN = re.compile(r"^edit_party_info:(\d+)$")
+_PICK_TIME_PATTERN = re.compile(r"^pick_time:(\d+):(\d+):(\d+)$")
+_TIME_PAGE_PATTERN = re.compile(r"^time_page:(\d+):(\d+)$")
+_OWN_CALLBACKS_PATTERN = re.compile(r"^(cbcal_|pick_time:|time_page:|set_info:|clear_info:|edit_party_info:)")
+
 # Conversation states
 TYPING_INFO_VALUE = 0
 PICKING_DATE = 1
 PICKING_TIME = 2
 
 
-def _calendar_markup(json_str: str) -> InlineKeyboardMarkup:
-    """Convert the JSON string from python-telegram-bot-calendar to InlineKeyboardMarkup."""
-    data = json.loads(json_str)
-    rows = []
-    for row in data["inline_keyboard"]:
-        rows.append([
-            InlineKeyboardButton(
-                text=btn["text"],
-                callback_data=btn.get("callback_data"),
-            )
-            for btn in row
-        ])
-    return InlineKeyboardMarkup(rows)
+class _DictCalendar(WMonthTelegramCalendar):
+    """WMonthTelegramCalendar that returns its keyboard as a dict instead of a JSON string."""
+
+    def _build_json_keyboard(self, buttons):
+        return {"inline_keyboard": buttons + self.additional_buttons}
+
+
+@dataclass(slots=True)
+class EditInfoState:
+    """Per-user state of the set-info conversation, stored under user_data["edit_info"]."""
+    party_id: int
+    field: str
+    picked_date: date | None = None
+    calendar: _DictCalendar | None = None  # created on entering the date picker, reused while navigating
+
+
+def _calendar_markup(data: dict) -> InlineKeyboardMarkup:
+    """Convert the keyboard dict from python-telegram-bot-calendar to InlineKeyboardMarkup."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(text=btn["text"], callback_data=btn.get("callback_data")) for btn in row]
+        for row in data["inline_keyboard"]
+    ])
 
 
 def _new_calendar():
-    """Create a fresh WMonthTelegramCalendar starting from today."""
-    return WMonthTelegramCalendar(calendar_id=CALENDAR_ID, min_date=date.today())
+    """Create a fresh calendar starting from today."""
+    return _DictCalendar(calendar_id=CALENDAR_ID, min_date=date.today())
 
 
-def _build_info_text(party_name: str, info: dict) -> str:
-    """Build the formatted party info message."""
-    lines = [f"ℹ️ <b>Party info for {esc(party_name)}</b>\n"]
+@lru_cache(maxsize=4096)
+def _edit_header(party_name: str) -> str:
+    """Header of the 'Edit info' menu. Keyed on the name, so renames never hit a stale entry."""
+    return (
+        f"✏️ <b>Edit info for {esc(party_name)}</b>\n\n"
+        "Tap a field to set or change it.\n"
+        "✅ = already set"
+    )
+
 
-    if info.get("info_datetime"):
-        lines.append(f"🕐 <b>Date & time:</b> {esc(info['info_datetime'])}")
-    if info.get("info_address"):
-        lines.append(f"📍 <b>Address:</b> {esc(info['info_address'])}")
-    if info.get("info_map_link"):
-        link = info["info_map_link"]
-        lines.append(f'🗺 <b>Map:</b> <a href="{esc(link)}">{esc(link)}</a>')
-    if info.get("info_description"):
-        lines.append(f"📝 <b>Notes:</b> {esc(info['info_description'])}")
+def _fmt_link(link: str) -> str:
+    return f'<a href="{esc(link)}">{esc(link)}</a>'
 
-    if len(lines) == 1:
-        lines.append("No info has been added yet.")
 
-    return "\n".join(lines)
+# (field, emoji, label, formatter) for each line of the party info message
+_INFO_LINES = (
+    ("info_datetime", "🕐", "Date & time", esc),
+    ("info_address", "📍", "Address", esc),
+    ("info_map_link", "🗺", "Map", _fmt_link),
+    ("info_description", "📝", "Notes", esc),
+)
+
+
+def _parse_time(raw: str) -> tuple[int, int] | None:
+    """Parse a typed time like "18:30", "18.30", "1830" or "18 30" into (hour, minute).
+
+    Range is not checked here. Returns None if the text isn't in one of these shapes.
+    """
+    hour_part, minute_part = raw[:-2], raw[-2:]
+    if hour_part and (hour_part[-1] in ":." or hour_part[-1].isspace()):
+        hour_part = hour_part[:-1]
+    if not (1 <= len(hour_part) <= 2 and hour_part.isdecimal() and minute_part.isdecimal()):
+        return None
+    return int(hour_part), int(minute_part)
+
+
+def _build_info_text(party_name: str, info: dict) -> str:
+    """Build the formatted party info message."""
+    lines = [
+        f"{emoji} <b>{label}:</b> {fmt(value)}"
+        for key, emoji, label, fmt in _INFO_LINES
+        if (value := info.get(key))
+    ]
+    return "\n".join([
+        f"ℹ️ <b>Party info for {esc(party_name)}</b>\n",
+        *(lines or ["No info has been added yet."]),
+    ])
 
 
 # --------------- Debounced info-change notifications ---------------
@@ -98,10 +146,12 @@ NOTIFICATION_DELAY = 30  # seconds — changes within this window are batched
 
 def _schedule_info_notification(
     context: ContextTypes.DEFAULT_TYPE, party_id: int, admin_id: int,
+    *, rendered_text: str,
 ) -> None:
     """Schedule (or reschedule) a debounced notification for party info changes.
 
     Every call resets the 30-second timer so rapid edits produce only one message.
+    rendered_text is the info text rendered at save time, so the job doesn't re-read the party.
     """
     job_name = f"info_notify_{party_id}"
     # Cancel any pending notification for this party (resets the timer)
@@ -111,7 +161,7 @@ def _schedule_info_notification(
     context.job_queue.run_once(
         _send_info_notification,
         when=NOTIFICATION_DELAY,
-        data={"party_id": party_id, "admin_id": admin_id},
+        data={"party_id": party_id, "admin_id": admin_id, "rendered_text": rendered_text},
         name=job_name,
     )
 
@@ -122,59 +172,43 @@ async def _send_info_notification(context: ContextTypes.DEFAULT_TYPE) -> None:
     party_id = data["party_id"]
     admin_id = data["admin_id"]
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        return  # Party was deleted before notification fired
+    # A deleted party simply has no members left
+    member_ids = [m["telegram_id"] for m in await db.get_members(party_id)]
+    recipients = [member_id for member_id in member_ids if member_id != admin_id]
+    if not recipients:
+        return
 
-    info = await db.get_party_info(party_id) or {}
-    members = await db.get_members(party_id)
+    text = f"📢 <b>Party info has been updated!</b>\n\n" + data["rendered_text"]
 
-    text = (
-        f"📢 <b>Party info has been updated!</b>\n\n"
-        + _build_info_text(party["name"], info)
+    await send_to_many(
+        context.bot,
+        recipients,
+        text=text,
+        parse_mode="HTML",
+        disable_web_page_preview=True,
+        disable_notification=True,  # informational update — deliver silently
     )
 
-    for m in members:
-        if m["telegram_id"] == admin_id:
-            continue
-        try:
-            await context.bot.send_message(
-                chat_id=m["telegram_id"],
-                text=text,
-                parse_mode="HTML",
-                disable_web_page_preview=True,
-            )
-        except Exception:
-            logger.debug("Could not notify user %s", m["telegram_id"])
-
 
 # --------------- View party info ---------------
 
 async def party_info_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show party info to any member."""
     query = update.callback_query
-    await query.answer()
+    answer_in_background(query)
     party_id = int(query.data.split(":")[1])
 
     user = update.effective_user
-    member = await db.get_member(party_id, user.id)
-    if member is None:
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_member"]:
         await query.edit_message_text(NOT_A_MEMBER_TEXT, reply_markup=main_menu_keyboard())
         return
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
-        return
-
-    info = await db.get_party_info(party_id)
-    is_admin = bool(member.get("is_admin"))
-
     await query.edit_message_text(
-        _build_info_text(party["name"], info or {}),
+        _build_info_text(party["name"], party),
         parse_mode="HTML",
         disable_web_page_preview=True,
-        reply_markup=party_info_keyboard(party_id, is_admin=is_admin),
+        reply_markup=party_info_keyboard(party_id, is_admin=party["is_admin"]),
     )
 
 
@@ -183,27 +217,19 @@ async def party_info_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def edit_party_info_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Admin: show field selection keyboard."""
     query = update.callback_query
-    await query.answer()
-    party_id = int(query.data.split(":")[1])
+    answer_in_background(query)
+    party_id = int(context.match.group(1))
 
     user = update.effective_user
-    if not await db.is_user_admin(party_id, user.id):
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await query.edit_message_text("You don't have permission to do this.")
         return
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
-        return
-
-    info = await db.get_party_info(party_id) or {}
-
     await query.edit_message_text(
-        f"✏️ <b>Edit info for {esc(party['name'])}</b>\n\n"
-        "Tap a field to set or change it.\n"
-        "✅ = already set",
+        _edit_header(party["name"]),
         parse_mode="HTML",
-        reply_markup=edit_info_keyboard(party_id, info),
+        reply_markup=edit_info_keyboard(party_id, party),
     )
 
 
@@ -213,35 +239,30 @@ async def set_info_start(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """Admin tapped a field to edit — prompt for input."""
     query = update.callback_query
     await query.answer()
-    parts = query.data.split(":")
-    party_id = int(parts[1])
-    field = parts[2]
-
-    if field not in db.INFO_FIELDS:
-        await query.edit_message_text("Invalid field.")
-        return ConversationHandler.END
+    party_id = int(context.match.group(1))
+    field = context.match.group(2)
 
     user = update.effective_user
-    if not await db.is_user_admin(party_id, user.id):
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await query.edit_message_text("You don't have permission to do this.")
         return ConversationHandler.END
 
-    info = await db.get_party_info(party_id) or {}
-    current = info.get(field)
+    current = party[field]
     label = FIELD_LABELS.get(field, field)
 
-    context.user_data["edit_info_party_id"] = party_id
-    context.user_data["edit_info_field"] = field
+    state = context.user_data["edit_info"] = EditInfoState(party_id, field)
 
     # Date & time: show inline calendar
     if field == "info_datetime":
-        cal_json, step = _new_calendar().build()
+        state.calendar = _new_calendar()
+        cal_keyboard, step = state.calendar.build()
         text = f"🕐 <b>Date & time</b>\n\n"
         if current:
             text += f"Current: {esc(current)}\n\n"
         text += f"Select the {LSTEP[step]}:"
         await query.edit_message_text(
-            text, parse_mode="HTML", reply_markup=_calendar_markup(cal_json),
+            text, parse_mode="HTML", reply_markup=_calendar_markup(cal_keyboard),
         )
         return PICKING_DATE
 
@@ -265,11 +286,17 @@ async def set_info_start(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 async def handle_calendar_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Process inline calendar button presses."""
     query = update.callback_query
-    await query.answer()
+    answer_in_background(query)
 
-    result, key, step = _new_calendar().process(query.data)
+    state = context.user_data.get("edit_info")
+    if state is None:
+        await query.edit_message_text("Something went wrong. Please try again.")
+        return ConversationHandler.END
 
-    party_id = context.user_data.get("edit_info_party_id")
+    if state.calendar is None:
+        state.calendar = _new_calendar()
+    result, key, step = state.calendar.process(query.data)
+    party_id = state.party_id
 
     if not result and key:
         # User navigated to a different month/year — update the calendar
@@ -282,7 +309,7 @@ async def handle_calendar_callback(update: Update, context: ContextTypes.DEFAULT
 
     if result:
         # User picked a date — save it and show time picker
-        context.user_data["edit_info_date"] = result
+        state.picked_date = result
         await query.edit_message_text(
             f"🕐 <b>Date & time</b>\n\n"
             f"Date: <b>{result.strftime('%b %d, %Y')}</b>\n\n"
@@ -303,12 +330,10 @@ async def handle_time_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     query = update.callback_query
     await query.answer()
 
-    parts = query.data.split(":")
-    party_id = int(parts[1])
-    hour = int(parts[2])
-    minute = int(parts[3])
+    party_id, hour, minute = map(int, context.match.groups())
 
-    picked_date = context.user_data.get("edit_info_date")
+    state = context.user_data.get("edit_info")
+    picked_date = state.picked_date if state else None
     if picked_date is None:
         await query.edit_message_text("Something went wrong. Please try again.")
         return ConversationHandler.END
@@ -324,13 +349,12 @@ async def handle_time_callback(update: Update, context: ContextTypes.DEFAULT_TYP
 async def handle_time_page(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Navigate between time picker pages."""
     query = update.callback_query
-    await query.answer()
+    answer_in_background(query)
 
-    parts = query.data.split(":")
-    party_id = int(parts[1])
-    page = int(parts[2])
+    party_id, page = map(int, context.match.groups())
 
-    picked_date = context.user_data.get("edit_info_date")
+    state = context.user_data.get("edit_info")
+    picked_date = state.picked_date if state else None
     date_str = picked_date.strftime('%b %d, %Y') if picked_date else "?"
 
     await query.edit_message_text(
@@ -345,18 +369,17 @@ async def handle_time_page(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
 async def receive_time_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Accept a typed time like '18:30', '18.30', '1830' while in PICKING_TIME state."""
-    party_id = context.user_data.get("edit_info_party_id")
-    picked_date = context.user_data.get("edit_info_date")
-
-    if picked_date is None:
+    state = context.user_data.get("edit_info")
+    if state is None or state.picked_date is None:
         await update.message.reply_text("Something went wrong. Please try again.")
         return ConversationHandler.END
+    party_id = state.party_id
+    picked_date = state.picked_date
 
     raw = update.message.text.strip()
 
-    # Try parsing common time formats: "18:30", "18.30", "1830", "18 30"
-    m = re.match(r"^(\d{1,2})[:.\s]?(\d{2})$", raw)
-    if not m:
+    parsed = _parse_time(raw)
+    if parsed is None:
         await update.message.reply_text(
             "⚠️ Couldn't parse that time. Use the buttons above, or type like <b>18:30</b>.",
             parse_mode="HTML",
@@ -364,7 +387,7 @@ async def receive_time_text(update: Update, context: ContextTypes.DEFAULT_TYPE)
         )
         return PICKING_TIME
 
-    hour, minute = int(m.group(1)), int(m.group(2))
+    hour, minute = parsed
     if not (0 <= hour <= 23 and 0 <= minute <= 59):
         await update.message.reply_text(
             "⚠️ Invalid time. Hours 0–23, minutes 0–59. Try again.",
@@ -393,16 +416,18 @@ async def _save_datetime(party_id, picked_date, hour, minute, *, send_func, cont
     value = f"{picked_date.strftime('%b %d, %Y')} at {hour:02d}:{minute:02d}"
     await db.update_party_info(party_id, "info_datetime", value)
 
-    party = await db.get_party_by_id(party_id)
+    # The party row already carries the info columns
+    party = info = await db.get_party_by_id(party_id)
     if party is None:
         await send_func("Party not found.", reply_markup=main_menu_keyboard())
         return ConversationHandler.END
-    info = await db.get_party_info(party_id) or {}
 
-    _schedule_info_notification(context, party_id, admin_id)
+    info_text = _build_info_text(party["name"], info)
+    _schedule_info_notification(context, party_id, admin_id, rendered_text=info_text)
+    context.user_data.pop("edit_info", None)
 
     await send_func(
-        f"✅ Date & time set!\n\n" + _build_info_text(party["name"], info),
+        f"✅ Date & time set!\n\n" + info_text,
         parse_mode="HTML",
         disable_web_page_preview=True,
         reply_markup=edit_info_keyboard(party_id, info),
@@ -414,15 +439,29 @@ async def _save_datetime(party_id, picked_date, hour, minute, *, send_func, cont
 
 async def receive_info_value(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Save the typed info value."""
-    party_id = context.user_data.get("edit_info_party_id")
-    field = context.user_data.get("edit_info_field")
+    state = context.user_data.get("edit_info")
+    if state is None:
+        await update.message.reply_text("Something went wrong. Please try again.")
+        return ConversationHandler.END
+    party_id = state.party_id
+    field = state.field
     user = update.effective_user
 
-    if not await db.is_user_admin(party_id, user.id):
+    raw = update.message.text
+    # Reject oversized input before the DB lookup and before stripping, so spam costs nothing
+    if len(raw) > 520:
+        await update.message.reply_text(
+            "⚠️ Too long (max 500 characters). Try shorter.",
+            reply_markup=edit_info_field_keyboard(party_id, field, False),
+        )
+        return TYPING_INFO_VALUE
+
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await update.message.reply_text("You don't have permission to do this.")
         return ConversationHandler.END
 
-    value = update.message.text.strip()
+    value = raw.strip()
     if not value:
         await update.message.reply_text(
             "Value can't be empty. Type something or cancel.",
@@ -438,26 +477,37 @@ async def receive_info_value(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return TYPING_INFO_VALUE
 
     # Validate map link is a proper URL
-    if field == "info_map_link" and not (value.startswith("http://") or value.startswith("https://")):
+    if field == "info_map_link" and not value.startswith(("http://", "https://")):
         await update.message.reply_text(
             "⚠️ Map link must start with http:// or https://",
             reply_markup=edit_info_field_keyboard(party_id, field, False),
         )
         return TYPING_INFO_VALUE
 
+    # Compare with the row fetched above, not the value shown when the prompt opened,
+    # so a concurrent edit by another admin isn't mistaken for "no change"
+    if value == party[field]:
+        context.user_data.pop("edit_info", None)
+        await update.message.reply_text(
+            "No change — that's already the current value.",
+            reply_markup=edit_info_keyboard(party_id, party),
+        )
+        return ConversationHandler.END
+
     await db.update_party_info(party_id, field, value)
+    info = await db.get_party_info(party_id)
 
     label = FIELD_LABELS.get(field, field)
-    party = await db.get_party_by_id(party_id)
-    if party is None:
+    if info is None:
         await update.message.reply_text("Party not found.", reply_markup=main_menu_keyboard())
         return ConversationHandler.END
-    info = await db.get_party_info(party_id) or {}
 
-    _schedule_info_notification(context, party_id, user.id)
+    info_text = _build_info_text(party["name"], info)
+    _schedule_info_notification(context, party_id, user.id, rendered_text=info_text)
+    context.user_data.pop("edit_info", None)
 
     await update.message.reply_text(
-        f"✅ {label} updated!\n\n" + _build_info_text(party["name"], info),
+        f"✅ {label} updated!\n\n" + info_text,
         parse_mode="HTML",
         disable_web_page_preview=True,
         reply_markup=edit_info_keyboard(party_id, info),
@@ -469,11 +519,16 @@ async def receive_info_value(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def receive_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle a shared location pin — save as Google Maps link."""
-    party_id = context.user_data.get("edit_info_party_id")
-    field = context.user_data.get("edit_info_field")
+    state = context.user_data.get("edit_info")
+    if state is None:
+        await update.message.reply_text("Something went wrong. Please try again.")
+        return ConversationHandler.END
+    party_id = state.party_id
+    field = state.field
     user = update.effective_user
 
-    if not await db.is_user_admin(party_id, user.id):
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await update.message.reply_text("You don't have permission to do this.")
         return ConversationHandler.END
 
@@ -491,13 +546,13 @@ async def receive_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     # Save the map link
     await db.update_party_info(party_id, "info_map_link", maps_url)
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
+    info = await db.get_party_info(party_id)
+    if info is None:
         await update.message.reply_text("Party not found.", reply_markup=main_menu_keyboard())
         return ConversationHandler.END
-    info = await db.get_party_info(party_id) or {}
 
-    _schedule_info_notification(context, party_id, user.id)
+    info_text = _build_info_text(party["name"], info)
+    _schedule_info_notification(context, party_id, user.id, rendered_text=info_text)
 
     # If we were editing the address field, prompt to also type the address text
     if field == "info_address":
@@ -510,8 +565,9 @@ async def receive_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         return TYPING_INFO_VALUE
 
     # Editing map link — done
+    context.user_data.pop("edit_info", None)
     await update.message.reply_text(
-        f"✅ Map link saved!\n\n" + _build_info_text(party["name"], info),
+        f"✅ Map link saved!\n\n" + info_text,
         parse_mode="HTML",
         disable_web_page_preview=True,
         reply_markup=edit_info_keyboard(party_id, info),
@@ -524,21 +580,20 @@ async def receive_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 async def cancel_set_info(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Cancel editing and go back to edit info menu."""
     query = update.callback_query
-    await query.answer()
-    party_id = context.user_data.get("edit_info_party_id")
+    answer_in_background(query)
+    state = context.user_data.pop("edit_info", None)
+    party_id = state.party_id if state else None
 
     if party_id:
+        # The party row already carries the info columns
         party = await db.get_party_by_id(party_id)
         if party is None:
             await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
             return ConversationHandler.END
-        info = await db.get_party_info(party_id) or {}
         await query.edit_message_text(
-            f"✏️ <b>Edit info for {esc(party['name'])}</b>\n\n"
-            "Tap a field to set or change it.\n"
-            "✅ = already set",
+            _edit_header(party["name"]),
             parse_mode="HTML",
-            reply_markup=edit_info_keyboard(party_id, info),
+            reply_markup=edit_info_keyboard(party_id, party),
         )
     else:
         await query.edit_message_text("Cancelled.")
@@ -556,48 +611,49 @@ async def clear_info_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
     """
     query = update.callback_query
     await query.answer()
-    parts = query.data.split(":")
-    party_id = int(parts[1])
-    field = parts[2]
-
-    if field not in db.INFO_FIELDS:
-        await query.edit_message_text("Invalid field.")
-        return ConversationHandler.END
+    party_id = int(context.match.group(1))
+    field = context.match.group(2)
 
     user = update.effective_user
-    if not await db.is_user_admin(party_id, user.id):
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await query.edit_message_text("You don't have permission to do this.")
         return ConversationHandler.END
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
-        return ConversationHandler.END
-
     await db.update_party_info(party_id, field, None)
+    info = await db.get_party_info(party_id) or {}
 
-    _schedule_info_notification(context, party_id, user.id)
+    _schedule_info_notification(
+        context, party_id, user.id, rendered_text=_build_info_text(party["name"], info),
+    )
+    context.user_data.pop("edit_info", None)
 
-    info = await db.get_party_info(party_id) or {}
     label = FIELD_LABELS.get(field, field)
 
     await query.edit_message_text(
-        f"🗑 {label} cleared.\n\n"
-        f"✏️ <b>Edit info for {esc(party['name'])}</b>\n\n"
-        "Tap a field to set or change it.\n"
-        "✅ = already set",
+        f"🗑 {label} cleared.\n\n" + _edit_header(party["name"]),
         parse_mode="HTML",
         reply_markup=edit_info_keyboard(party_id, info),
     )
     return ConversationHandler.END
 
 
+# --------------- Busy (previous step still running) ---------------
+
+async def answer_while_busy(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Answer a tap that arrives while the previous step is still saving.
+
+    The conversation drops such updates, so without this the button would keep spinning.
+    """
+    await update.callback_query.answer("⏳ One moment…")
+
+
 # --------------- Conversation builder ---------------
 
 def set_info_conversation() -> ConversationHandler:
     return ConversationHandler(
         entry_points=[
-            CallbackQueryHandler(set_info_start, pattern=r"^set_info:\d+:info_\w+$"),
+            CallbackQueryHandler(set_info_start, pattern=SET_INFO_PATTERN),
         ],
         states={
             TYPING_INFO_VALUE: [
@@ -609,15 +665,24 @@ def set_info_conversation() -> ConversationHandler:
                 MessageHandler(filters.TEXT & ~filters.COMMAND, receive_date_text),
             ],
             PICKING_TIME: [
-                CallbackQueryHandler(handle_time_callback, pattern=r"^pick_time:\d+:\d+:\d+$"),
-                CallbackQueryHandler(handle_time_page, pattern=r"^time_page:\d+:\d+$"),
+                CallbackQueryHandler(handle_time_callback, pattern=_PICK_TIME_PATTERN),
+                CallbackQueryHandler(handle_time_page, pattern=_TIME_PAGE_PATTERN),
                 MessageHandler(filters.TEXT & ~filters.COMMAND, receive_time_text),
             ],
+            ConversationHandler.WAITING: [
+                # Only this conversation's buttons; other taps still reach their normal handlers
+                CallbackQueryHandler(answer_while_busy, pattern=_OWN_CALLBACKS_PATTERN),
+            ],
         },
         fallbacks=[
-            CallbackQueryHandler(clear_info_callback, pattern=r"^clear_info:\d+:info_\w+$"),
-            CallbackQueryHandler(cancel_set_info, pattern=r"^edit_party_info:\d+$"),
+            CallbackQueryHandler(clear_info_callback, pattern=CLEAR_INFO_PATTERN),
+            CallbackQueryHandler(cancel_set_info, pattern=EDIT_INFO_PATTERN),
         ],
+        # per_message must stay False: the text/location MessageHandlers can't be tracked per message.
+        # block=False runs each step as a background task so it doesn't hold up other updates.
+        # Until that task finishes the conversation ignores this user's updates; the WAITING
+        # handler answers taps on its own buttons, and text sent meanwhile is dropped.
         per_message=False,
         allow_reentry=True,
+        block=False,
     )
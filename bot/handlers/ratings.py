@@ -14,14 +14,18 @@ from bot.keyboards import (
     rating_stars_keyboard,
     ratings_view_keyboard,
 )
-from bot.utils import esc
+from bot.utils import esc, send_to_many
 
 logger = logging.getLogger(__name__)
 
 
+# Star strings for every possible rating, indexed by rating (0–5)
+_STAR_CACHE = tuple("⭐" * i + "☆" * (5 - i) for i in range(6))
+
+
 def _star_display(rating: int) -> str:
     """Return a visual star string like ⭐⭐⭐☆☆ for a rating 1–5."""
-    return "⭐" * rating + "☆" * (5 - rating)
+    return _STAR_CACHE[rating]
 
 
 # --------------- Admin: send rating request ---------------
@@ -33,15 +37,11 @@ async def rate_party_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
     party_id = int(query.data.split(":")[1])
 
     user = update.effective_user
-    if not await db.is_user_admin(party_id, user.id):
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await query.edit_message_text("You don't have permission to do this.")
         return
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
-        return
-
     members = await db.get_members(party_id)
     count = len(members)
 
@@ -61,15 +61,11 @@ async def confirm_send_ratings_callback(update: Update, context: ContextTypes.DE
     party_id = int(query.data.split(":")[1])
 
     user = update.effective_user
-    if not await db.is_user_admin(party_id, user.id):
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_admin"]:
         await query.edit_message_text("You don't have permission to do this.")
         return
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
-        return
-
     members = await db.get_members(party_id)
 
     rating_text = (
@@ -77,19 +73,13 @@ async def confirm_send_ratings_callback(update: Update, context: ContextTypes.DE
         "Tap to rate from 1 to 5 stars:"
     )
 
-    sent = 0
-    failed = 0
-    for m in members:
-        try:
-            await context.bot.send_message(
-                chat_id=m["telegram_id"],
-                text=rating_text,
-                parse_mode="HTML",
-                reply_markup=rating_stars_keyboard(party_id),
-            )
-            sent += 1
-        except Exception:
-            failed += 1
+    sent, failed = await send_to_many(
+        context.bot,
+        [m["telegram_id"] for m in members],
+        text=rating_text,
+        parse_mode="HTML",
+        reply_markup=rating_stars_keyboard(party_id),
+    )
 
     result = f"✅ Rating request sent to {sent} member(s)!"
     if failed:
@@ -170,22 +160,24 @@ async def view_ratings_callback(update: Update, context: ContextTypes.DEFAULT_TY
     party_id = int(query.data.split(":")[1])
 
     user = update.effective_user
-    member = await db.get_member(party_id, user.id)
-    if member is None:
+    party = await db.get_party_context(party_id, user.id)
+    if party is None or not party["is_member"]:
         await query.edit_message_text(
             "⚠️ You are no longer a member of this party.",
             reply_markup=main_menu_keyboard(),
         )
         return
 
-    party = await db.get_party_by_id(party_id)
-    if party is None:
-        await query.edit_message_text("Party not found.", reply_markup=main_menu_keyboard())
-        return
-
-    ratings = await db.get_ratings(party_id)
+    # Only admins see individual ratings; everyone else just needs the aggregate
+    is_admin = party["is_admin"]
+    if is_admin:
+        ratings = await db.get_ratings(party_id)
+        count = len(ratings)
+        avg = sum(r["rating"] for r in ratings) / count if count else None
+    else:
+        count, avg = await db.get_ratings_summary(party_id)
 
-    if not ratings:
+    if not count:
         await query.edit_message_text(
             f"📊 <b>Ratings for {esc(party['name'])}</b>\n\n"
             "No ratings yet.",
@@ -194,20 +186,18 @@ async def view_ratings_callback(update: Update, context: ContextTypes.DEFAULT_TY
         )
         return
 
-    total = sum(r["rating"] for r in ratings)
-    avg = total / len(ratings)
     avg_stars = round(avg)
 
     lines = [
         f"📊 <b>Ratings for {esc(party['name'])}</b>\n",
-        f"{_star_display(avg_stars)} <b>{avg:.1f}</b>/5  ({len(ratings)} rating(s))\n",
+        f"{_star_display(avg_stars)} <b>{avg:.1f}</b>/5  ({count} rating(s))\n",
     ]
 
-    is_admin = bool(member.get("is_admin"))
-    if is_admin and ratings:
+    if is_admin:
         lines.append("")
-        for r in ratings:
-            lines.append(f"{_star_display(r['rating'])} — {esc(r['telegram_name'])}")
+        lines.append("\n".join(
+            f"{_STAR_CACHE[r['rating']]} — {esc(r['telegram_name'])}" for r in ratings
+        ))
 
     await query.edit_message_text(
         "\n".join(lines),
@@ -1,11 +1,13 @@
 """Handlers for /start, main menu, deep-link join, and 'my parties' list."""
 
+import asyncio
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from bot import database as db
-from bot.keyboards import main_menu_keyboard, parties_list_keyboard, party_menu_keyboard
-from bot.utils import esc, user_display_name
+from bot.keyboards import main_menu_keyboard, main_menu_keyboard_json, parties_list_keyboard, party_menu_keyboard
+from bot.utils import edit_if_changed, esc, recall_join, remember_join, user_display_name
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -15,30 +17,32 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
     if args:
         code = args[0]
-        party = await db.get_party_by_code(code)
-        if party is None:
-            await update.message.reply_text(
-                "😕 Party not found. The link may be invalid or expired.",
-                reply_markup=main_menu_keyboard(),
-            )
-            return
-
-        # Auto-join
-        display = user_display_name(user)
-        newly_joined = await db.add_member(party["id"], user.id, display)
-
-        if newly_joined:
+        party = recall_join(context.user_data, code)
+        if party is not None:
+            # Double tap on the same link — already joined a moment ago
+            party = {**party, "newly_joined": False}
+        else:
+            # Auto-join
+            party = await db.join_party_by_code(code, user.id, user_display_name(user))
+            if party is None:
+                await update.message.reply_text(
+                    "😕 Party not found. The link may be invalid or expired.",
+                    reply_markup=main_menu_keyboard(),
+                )
+                return
+            remember_join(context.user_data, code, party)
+
+        if party["newly_joined"]:
             text = f"🎉 Welcome to <b>{esc(party['name'])}</b>! You've joined the party."
         else:
             text = f"👋 You're already in <b>{esc(party['name'])}</b>!"
 
-        is_admin = await db.is_user_admin(party["id"], user.id)
         is_owner = party["creator_id"] == user.id
 
         await update.message.reply_text(
             text,
             parse_mode="HTML",
-            reply_markup=party_menu_keyboard(party["id"], is_admin=is_admin, is_owner=is_owner),
+            reply_markup=party_menu_keyboard(party["id"], is_admin=party["is_admin"], is_owner=is_owner),
         )
         return
 
@@ -48,7 +52,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         "Create a party and invite friends to coordinate who brings what "
         "— so nobody brings the same thing.",
         parse_mode="HTML",
-        reply_markup=main_menu_keyboard(),
+        # Plain /start is the hottest send and its keyboard never changes — skip re-serializing it
+        api_kwargs={"reply_markup": main_menu_keyboard_json()},
     )
 
 
@@ -56,7 +61,8 @@ async def main_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Show main menu (from inline button)."""
     query = update.callback_query
     await query.answer()
-    await query.edit_message_text(
+    await edit_if_changed(
+        query,
         "🎉 <b>Party Planner Bot</b>\n\nWhat would you like to do?",
         parse_mode="HTML",
         reply_markup=main_menu_keyboard(),
@@ -85,19 +91,21 @@ async def parties_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 async def my_parties_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show list of parties the user belongs to (from inline button)."""
     query = update.callback_query
-    await query.answer()
     user = update.effective_user
 
-    parties = await db.get_parties_for_user(user.id)
+    # Acknowledge the tap while the party list is being fetched
+    parties, _ = await asyncio.gather(db.get_parties_for_user(user.id), query.answer())
     if not parties:
-        await query.edit_message_text(
+        await edit_if_changed(
+            query,
             "You haven't joined any parties yet.\n"
             "Create one or ask a friend for an invite link!",
             reply_markup=main_menu_keyboard(),
         )
         return
 
-    await query.edit_message_text(
+    await edit_if_changed(
+        query,
         "📋 <b>Your parties:</b>",
         parse_mode="HTML",
         reply_markup=parties_list_keyboard(parties, user.id),
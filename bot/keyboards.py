@@ -1,12 +1,30 @@
 """Inline keyboard builders."""
 
+from functools import cache, lru_cache
 from urllib.parse import quote
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+# Keyboards that depend only on small int args are memoised; PTB markups are
+# immutable once built, so the same instance can be sent any number of times.
+
+_BACK_TO_MY_PARTIES_ROW = [InlineKeyboardButton("⬅️ Back to my parties", callback_data="my_parties")]
+_MAIN_MENU_ROW = [InlineKeyboardButton("⬅️ Main menu", callback_data="main_menu")]
+
+# Bound callback_data templates for buttons built in loops
+_OPEN_PARTY_TPL = "open_party:{}".format
+_EDIT_ONE_FILLING_TPL = "edit_one_filling:{}".format
+_PICK_TIME_TPL = "pick_time:{}:{}".format
+_TIME_PAGE_TPL = "time_page:{}:{}".format
+_RATE_TPL = "rate:{}:{}".format
+_DEMOTE_TPL = "demote_admin:{}:{}".format
+_PROMOTE_TPL = "promote_admin:{}:{}".format
+_KICK_TPL = "kick_member:{}:{}".format
+
 
 # ---- Main menu ----
 
+@cache
 def main_menu_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
@@ -16,25 +34,38 @@ def main_menu_keyboard() -> InlineKeyboardMarkup:
     )
 
 
+@cache
+def main_menu_keyboard_json() -> str:
+    """main_menu_keyboard() serialized once, for sending via api_kwargs without re-encoding."""
+    return main_menu_keyboard().to_json()
+
+
 # ---- Party menu ----
 
-def party_menu_keyboard(party_id: int, is_admin: bool = False, is_owner: bool = False) -> InlineKeyboardMarkup:
-    buttons = [
+@lru_cache(maxsize=4096)
+def _base_party_rows(party_id: int) -> tuple[list[InlineKeyboardButton], ...]:
+    """Rows every member sees, shared by the admin/owner variants of the menu."""
+    return (
         [InlineKeyboardButton("ℹ️ Party info", callback_data=f"party_info:{party_id}")],
         [InlineKeyboardButton("📜 What we're bringing", callback_data=f"view_fillings:{party_id}")],
         [InlineKeyboardButton("➕ I'm bringing…", callback_data=f"add_filling:{party_id}")],
         [InlineKeyboardButton("✏️ Edit my contributions", callback_data=f"edit_fillings:{party_id}")],
         [InlineKeyboardButton("👥 Members", callback_data=f"members:{party_id}")],
         [InlineKeyboardButton("🔗 Invite", callback_data=f"invite_link:{party_id}")],
-    ]
-    buttons.append([InlineKeyboardButton("📊 Ratings", callback_data=f"view_ratings:{party_id}")])
+        [InlineKeyboardButton("📊 Ratings", callback_data=f"view_ratings:{party_id}")],
+    )
+
+
+@lru_cache(maxsize=8192)
+def party_menu_keyboard(party_id: int, is_admin: bool = False, is_owner: bool = False) -> InlineKeyboardMarkup:
+    buttons = list(_base_party_rows(party_id))
     if is_admin:
         buttons.append([InlineKeyboardButton("⭐ Rate the party", callback_data=f"rate_party:{party_id}")])
         buttons.append([InlineKeyboardButton("📢 Send message", callback_data=f"broadcast:{party_id}")])
         buttons.append([InlineKeyboardButton("🚫 Cancel party", callback_data=f"cancel_party:{party_id}")])
     if not is_owner:
         buttons.append([InlineKeyboardButton("🚪 Leave party", callback_data=f"leave_party:{party_id}")])
-    buttons.append([InlineKeyboardButton("⬅️ Back to my parties", callback_data="my_parties")])
+    buttons.append(_BACK_TO_MY_PARTIES_ROW)
     return InlineKeyboardMarkup(buttons)
 
 
@@ -59,13 +90,14 @@ def parties_list_keyboard(parties: list[dict], user_id: int) -> InlineKeyboardMa
         creator_name = p.get("creator_name")
         if creator_name and p["creator_id"] != user_id:
             label += f"  ({creator_name})"
-        buttons.append([InlineKeyboardButton(label, callback_data=f"open_party:{p['id']}")])
-    buttons.append([InlineKeyboardButton("⬅️ Main menu", callback_data="main_menu")])
+        buttons.append([InlineKeyboardButton(label, callback_data=_OPEN_PARTY_TPL(p["id"]))])
+    buttons.append(_MAIN_MENU_ROW)
     return InlineKeyboardMarkup(buttons)
 
 
 # ---- Party info ----
 
+@lru_cache(maxsize=4096)
 def party_info_keyboard(party_id: int, is_admin: bool = False) -> InlineKeyboardMarkup:
     buttons = []
     if is_admin:
@@ -74,18 +106,29 @@ def party_info_keyboard(party_id: int, is_admin: bool = False) -> InlineKeyboard
     return InlineKeyboardMarkup(buttons)
 
 
+_EDIT_INFO_FIELDS = (
+    ("info_datetime", "🕐 Date & time"),
+    ("info_address", "📍 Address"),
+    ("info_map_link", "🗺 Map link"),
+    ("info_description", "📝 Description"),
+)
+
+
 def edit_info_keyboard(party_id: int, info: dict) -> InlineKeyboardMarkup:
     """Keyboard for choosing which info field to edit. Shows 'Clear' hint if field is set."""
-    fields = [
-        ("info_datetime", "🕐 Date & time"),
-        ("info_address", "📍 Address"),
-        ("info_map_link", "🗺 Map link"),
-        ("info_description", "📝 Description"),
-    ]
+    # Only set/unset matters for the buttons, so key the cache on a bitmask of set fields
+    fields_set_mask = 0
+    for i, (field_key, _) in enumerate(_EDIT_INFO_FIELDS):
+        if info.get(field_key):
+            fields_set_mask |= 1 << i
+    return _edit_info_keyboard(party_id, fields_set_mask)
+
+
+@lru_cache(maxsize=512)
+def _edit_info_keyboard(party_id: int, fields_set_mask: int) -> InlineKeyboardMarkup:
     buttons = []
-    for field_key, label in fields:
-        current = info.get(field_key)
-        btn_label = f"{label} ✅" if current else label
+    for i, (field_key, label) in enumerate(_EDIT_INFO_FIELDS):
+        btn_label = f"{label} ✅" if fields_set_mask & (1 << i) else label
         buttons.append([InlineKeyboardButton(btn_label, callback_data=f"set_info:{party_id}:{field_key}")])
     buttons.append([InlineKeyboardButton("⬅️ Back to info", callback_data=f"party_info:{party_id}")])
     return InlineKeyboardMarkup(buttons)
@@ -100,37 +143,51 @@ _TIME_PAGES = [
 # Page 0: 00:00–07:30  |  Page 1: 08:00–15:30  |  Page 2: 16:00–23:30
 DEFAULT_TIME_PAGE = 2  # evening — most common for parties
 
+_TIME_PICKER_COLUMNS = 4
+
+
+def _page_range_label(page: int) -> str:
+    slots = _TIME_PAGES[page]
+    return f"{slots[0][0]:02d}:00–{slots[-1][0]:02d}:30"
+
 
+# Per page: rows of (button label, "hour:minute" callback suffix)
+_TIME_PAGE_LABELS = [
+    [
+        [(f"{h:02d}:{m:02d}", f"{h}:{m}") for h, m in slots[i:i + _TIME_PICKER_COLUMNS]]
+        for i in range(0, len(slots), _TIME_PICKER_COLUMNS)
+    ]
+    for slots in _TIME_PAGES
+]
+# Per page: (label, target page) for the prev/next arrows that exist
+_TIME_NAV_LABELS = [
+    [
+        *([(f"◀ {_page_range_label(page - 1)}", page - 1)] if page > 0 else []),
+        *([(f"{_page_range_label(page + 1)} ▶", page + 1)] if page < len(_TIME_PAGES) - 1 else []),
+    ]
+    for page in range(len(_TIME_PAGES))
+]
+
+
+@lru_cache(maxsize=512)
 def time_picker_keyboard(party_id: int, page: int = DEFAULT_TIME_PAGE) -> InlineKeyboardMarkup:
-    """Paginated grid of half-hour buttons (full 24 h), 4 per row, with nav arrows."""
+    """Paginated grid of half-hour buttons (full 24 h), 4 per row, with nav arrows.
+
+    Cached: the markup depends only on the arguments and PTB markups are immutable.
+    Labels are precomputed; only the party id is substituted into callback data.
+    """
     page = max(0, min(page, len(_TIME_PAGES) - 1))
-    slots = _TIME_PAGES[page]
 
-    buttons = []
-    row = []
-    for h, m in slots:
-        label = f"{h:02d}:{m:02d}"
-        row.append(InlineKeyboardButton(label, callback_data=f"pick_time:{party_id}:{h}:{m}"))
-        if len(row) == 4:
-            buttons.append(row)
-            row = []
-    if row:
-        buttons.append(row)
+    buttons = [
+        [InlineKeyboardButton(label, callback_data=_PICK_TIME_TPL(party_id, suffix)) for label, suffix in row]
+        for row in _TIME_PAGE_LABELS[page]
+    ]
 
     # Navigation arrows
-    nav = []
-    if page > 0:
-        prev_range = _TIME_PAGES[page - 1]
-        nav.append(InlineKeyboardButton(
-            f"◀ {prev_range[0][0]:02d}:00–{prev_range[-1][0]:02d}:30",
-            callback_data=f"time_page:{party_id}:{page - 1}",
-        ))
-    if page < len(_TIME_PAGES) - 1:
-        next_range = _TIME_PAGES[page + 1]
-        nav.append(InlineKeyboardButton(
-            f"{next_range[0][0]:02d}:00–{next_range[-1][0]:02d}:30 ▶",
-            callback_data=f"time_page:{party_id}:{page + 1}",
-        ))
+    nav = [
+        InlineKeyboardButton(label, callback_data=_TIME_PAGE_TPL(party_id, target))
+        for label, target in _TIME_NAV_LABELS[page]
+    ]
     if nav:
         buttons.append(nav)
 
@@ -149,6 +206,7 @@ def edit_info_field_keyboard(party_id: int, field: str, has_value: bool) -> Inli
 
 # ---- Fillings list ----
 
+@lru_cache(maxsize=4096)
 def fillings_list_keyboard(party_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
@@ -167,7 +225,7 @@ def user_fillings_keyboard(fillings: list[dict], party_id: int) -> InlineKeyboar
             [
                 InlineKeyboardButton(
                     f"✏️ {f['name']}",
-                    callback_data=f"edit_one_filling:{f['id']}",
+                    callback_data=_EDIT_ONE_FILLING_TPL(f["id"]),
                 ),
             ]
         )
@@ -177,6 +235,7 @@ def user_fillings_keyboard(fillings: list[dict], party_id: int) -> InlineKeyboar
 
 # ---- Single filling edit ----
 
+@lru_cache(maxsize=4096)
 def edit_filling_keyboard(filling_id: int, party_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
@@ -189,6 +248,7 @@ def edit_filling_keyboard(filling_id: int, party_id: int) -> InlineKeyboardMarku
 
 # ---- Leave party confirmation ----
 
+@lru_cache(maxsize=4096)
 def confirm_leave_keyboard(party_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
@@ -200,6 +260,7 @@ def confirm_leave_keyboard(party_id: int) -> InlineKeyboardMarkup:
 
 # ---- Members ----
 
+@lru_cache(maxsize=4096)
 def members_keyboard(party_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup([
         [InlineKeyboardButton("🔍 Search member", callback_data=f"search_member:{party_id}")],
@@ -215,33 +276,34 @@ def admin_members_keyboard(members: list[dict], party_id: int, viewer_id: int) -
     viewer_id is the telegram_id of the user viewing this list.
     Admins can promote/demote other members and kick non-owners.
     """
-    buttons = []
-    for m in members:
-        if m["telegram_id"] == viewer_id:
-            # Don't show buttons for yourself
-            continue
-        row = []
-        if m.get("is_admin"):
-            row.append(InlineKeyboardButton(
-                f"⬇️ {m['telegram_name']}",
-                callback_data=f"demote_admin:{party_id}:{m['telegram_id']}",
-            ))
-        else:
-            row.append(InlineKeyboardButton(
-                f"⬆️ {m['telegram_name']}",
-                callback_data=f"promote_admin:{party_id}:{m['telegram_id']}",
-            ))
-        row.append(InlineKeyboardButton(
-            f"❌",
-            callback_data=f"kick_member:{party_id}:{m['telegram_id']}",
-        ))
-        buttons.append(row)
+    # Only these fields show up on the buttons, so the markup is cached on them.
+    # The viewer gets no buttons for themselves, so they're left out of the key up front.
+    others = tuple(
+        (m["telegram_id"], m["telegram_name"], bool(m.get("is_admin")))
+        for m in members
+        if m["telegram_id"] != viewer_id
+    )
+    return _admin_members_keyboard(party_id, others)
+
+
+@lru_cache(maxsize=1024)
+def _admin_members_keyboard(party_id: int, others: tuple[tuple[int, str, bool], ...]) -> InlineKeyboardMarkup:
+    buttons = [
+        [
+            InlineKeyboardButton(f"⬇️ {telegram_name}", callback_data=_DEMOTE_TPL(party_id, telegram_id))
+            if is_admin
+            else InlineKeyboardButton(f"⬆️ {telegram_name}", callback_data=_PROMOTE_TPL(party_id, telegram_id)),
+            InlineKeyboardButton("❌", callback_data=_KICK_TPL(party_id, telegram_id)),
+        ]
+        for telegram_id, telegram_name, is_admin in others
+    ]
     buttons.append([InlineKeyboardButton("⬅️ Back to party", callback_data=f"open_party:{party_id}")])
     return InlineKeyboardMarkup(buttons)
 
 
 # ---- Confirm kick ----
 
+@lru_cache(maxsize=4096)
 def confirm_kick_keyboard(party_id: int, telegram_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
@@ -253,6 +315,7 @@ def confirm_kick_keyboard(party_id: int, telegram_id: int) -> InlineKeyboardMark
 
 # ---- Cancel party confirmation ----
 
+@lru_cache(maxsize=4096)
 def confirm_cancel_party_keyboard(party_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
@@ -274,8 +337,8 @@ def confirm_send_ratings_keyboard(party_id: int) -> InlineKeyboardMarkup:
 def _star_buttons(party_id: int) -> list[list[InlineKeyboardButton]]:
     """Two rows of star rating buttons (1–3 and 4–5) for comfortable mobile tapping."""
     return [
-        [InlineKeyboardButton(f"{i}⭐", callback_data=f"rate:{party_id}:{i}") for i in range(1, 4)],
-        [InlineKeyboardButton(f"{i}⭐", callback_data=f"rate:{party_id}:{i}") for i in range(4, 6)],
+        [InlineKeyboardButton(f"{i}⭐", callback_data=_RATE_TPL(party_id, i)) for i in range(1, 4)],
+        [InlineKeyboardButton(f"{i}⭐", callback_data=_RATE_TPL(party_id, i)) for i in range(4, 6)],
     ]
 
 
@@ -299,6 +362,7 @@ def ratings_view_keyboard(party_id: int) -> InlineKeyboardMarkup:
 
 # ---- Cancel (used during text input flows) ----
 
+@cache
 def cancel_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [[InlineKeyboardButton("❌ Cancel", callback_data="cancel")]]
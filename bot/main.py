@@ -1,11 +1,20 @@
 """Entry point – build the Application, register handlers, start polling."""
 
+import asyncio
 import logging
 
-from telegram import BotCommand
-from telegram.ext import ApplicationBuilder, CommandHandler, CallbackQueryHandler
+from telegram import BotCommand, Update
+from telegram.ext import (
+    AIORateLimiter,
+    ApplicationBuilder,
+    BaseUpdateProcessor,
+    CallbackQueryHandler,
+    CommandHandler,
+    ContextTypes,
+    Defaults,
+)
 
-from bot.config import BOT_TOKEN, DATABASE_URL
+from bot.config import BOT_TOKEN, DATABASE_URL, PORT, WEBHOOK_PATH, WEBHOOK_SECRET, WEBHOOK_URL
 from bot import database as db
 
 from bot.handlers.start import start_command, parties_command, main_menu_callback, my_parties_callback
@@ -37,6 +46,8 @@ from bot.handlers.members import (
     members_callback,
 )
 from bot.handlers.party_info import (
+    CLEAR_INFO_PATTERN,
+    EDIT_INFO_PATTERN,
     clear_info_callback,
     edit_party_info_callback,
     party_info_callback,
@@ -57,9 +68,118 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Plain callback handlers keyed by the action prefix of their callback data ("action[:id[:id]]")
+_CALLBACK_ACTIONS = {
+    "main_menu": main_menu_callback,
+    "my_parties": my_parties_callback,
+    "open_party": open_party_callback,
+    "invite_link": invite_link_callback,
+    "view_fillings": view_fillings_callback,
+    "edit_fillings": edit_fillings_callback,
+    "edit_one_filling": edit_one_filling_callback,
+    "remove_filling": remove_filling_callback,
+    "members": members_callback,
+    "leave_party": leave_party_callback,
+    "confirm_leave": confirm_leave_callback,
+    "cancel_party": cancel_party_callback,
+    "confirm_cancel_party": confirm_cancel_party_callback,
+    "kick_member": kick_member_callback,
+    "confirm_kick": confirm_kick_callback,
+    "promote_admin": promote_admin_callback,
+    "demote_admin": demote_admin_callback,
+    "party_info": party_info_callback,
+    "rate_party": rate_party_callback,
+    "confirm_rate": confirm_send_ratings_callback,
+    "rate": handle_rating_callback,
+    "view_ratings": view_ratings_callback,
+    "dismiss_rating": dismiss_rating_callback,
+}
+
+
+def _is_plain_action(data: object) -> bool:
+    # Used as the CallbackQueryHandler pattern: one split and dict lookup instead of a regex
+    return isinstance(data, str) and data.partition(":")[0] in _CALLBACK_ACTIONS
+
+
+async def _dispatch_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Route a callback query to its handler by action name."""
+    action = update.callback_query.data.partition(":")[0]
+    await _CALLBACK_ACTIONS[action](update, context)
+
+
+class _PerChatUpdateProcessor(BaseUpdateProcessor):
+    """Process updates from different chats concurrently, and dispatch one chat's updates in order.
+
+    Conversation state is per chat/user, so two messages from the same chat must
+    not race through a ConversationHandler. With Defaults(block=False) most
+    handlers only get scheduled here; only the block=True conversation steps
+    actually run one at a time per chat.
+    """
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        # PTB holds its own semaphore slot for all of do_process_update, including the wait for
+        # the chat lock, so a burst from one stuck chat could take every slot. Keep that limit
+        # out of the way and count only updates that hold their chat's lock.
+        super().__init__(1_000_000)
+        self._slots = asyncio.Semaphore(max_concurrent_updates)
+        # chat id -> (lock, number of updates holding or waiting for it); dropped when unused
+        self._chat_locks: dict[int, list] = {}
+
+    async def do_process_update(self, update: object, coroutine) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            async with self._slots:
+                await coroutine
+            return
+
+        entry = self._chat_locks.get(chat.id)
+        if entry is None:
+            entry = self._chat_locks[chat.id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0], self._slots:
+                await coroutine
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._chat_locks[chat.id]
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
 def main() -> None:
     """Build and run the bot."""
-    app = ApplicationBuilder().token(BOT_TOKEN).build()
+    try:
+        import uvloop
+    except ImportError:  # not available on Windows; the default loop works fine there
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    app = (
+        ApplicationBuilder()
+        .token(BOT_TOKEN)
+        # Callback taps each trigger an edit/reply, so allow many concurrent API requests
+        .connection_pool_size(256)
+        .pool_timeout(20.0)
+        .connect_timeout(10.0)
+        .read_timeout(20.0)
+        .get_updates_connection_pool_size(16)
+        .get_updates_pool_timeout(30.0)
+        # Throttle outgoing API calls and retry on RetryAfter instead of failing the handler
+        .rate_limiter(AIORateLimiter(overall_max_rate=25, group_max_rate=20, max_retries=3))
+        # Run handlers as background tasks so a slow DB query doesn't hold up other updates.
+        # Text-input conversations opt back into block=True so each step finishes before the
+        # chat's next update is dispatched.
+        .defaults(Defaults(block=False))
+        # Dispatch up to 256 updates at once across chats, each chat's in arrival order
+        .concurrent_updates(_PerChatUpdateProcessor(256))
+        .build()
+    )
 
     # --- Conversation handlers (must be added before plain callback handlers) ---
     app.add_handler(create_party_conversation())
@@ -75,31 +195,10 @@ def main() -> None:
     app.add_handler(CommandHandler("parties", parties_command))
 
     # --- Callback query handlers ---
-    app.add_handler(CallbackQueryHandler(main_menu_callback, pattern=r"^main_menu$"))
-    app.add_handler(CallbackQueryHandler(my_parties_callback, pattern=r"^my_parties$"))
-    app.add_handler(CallbackQueryHandler(open_party_callback, pattern=r"^open_party:\d+$"))
-    app.add_handler(CallbackQueryHandler(invite_link_callback, pattern=r"^invite_link:\d+$"))
-    app.add_handler(CallbackQueryHandler(view_fillings_callback, pattern=r"^view_fillings:\d+$"))
-    app.add_handler(CallbackQueryHandler(edit_fillings_callback, pattern=r"^edit_fillings:\d+$"))
-    app.add_handler(CallbackQueryHandler(edit_one_filling_callback, pattern=r"^edit_one_filling:\d+$"))
-    app.add_handler(CallbackQueryHandler(remove_filling_callback, pattern=r"^remove_filling:\d+$"))
-    app.add_handler(CallbackQueryHandler(members_callback, pattern=r"^members:\d+$"))
-    app.add_handler(CallbackQueryHandler(leave_party_callback, pattern=r"^leave_party:\d+$"))
-    app.add_handler(CallbackQueryHandler(confirm_leave_callback, pattern=r"^confirm_leave:\d+$"))
-    app.add_handler(CallbackQueryHandler(cancel_party_callback, pattern=r"^cancel_party:\d+$"))
-    app.add_handler(CallbackQueryHandler(confirm_cancel_party_callback, pattern=r"^confirm_cancel_party:\d+$"))
-    app.add_handler(CallbackQueryHandler(kick_member_callback, pattern=r"^kick_member:\d+:\d+$"))
-    app.add_handler(CallbackQueryHandler(confirm_kick_callback, pattern=r"^confirm_kick:\d+:\d+$"))
-    app.add_handler(CallbackQueryHandler(promote_admin_callback, pattern=r"^promote_admin:\d+:\d+$"))
-    app.add_handler(CallbackQueryHandler(demote_admin_callback, pattern=r"^demote_admin:\d+:\d+$"))
-    app.add_handler(CallbackQueryHandler(party_info_callback, pattern=r"^party_info:\d+$"))
-    app.add_handler(CallbackQueryHandler(edit_party_info_callback, pattern=r"^edit_party_info:\d+$"))
-    app.add_handler(CallbackQueryHandler(clear_info_callback, pattern=r"^clear_info:\d+:info_\w+$"))
-    app.add_handler(CallbackQueryHandler(rate_party_callback, pattern=r"^rate_party:\d+$"))
-    app.add_handler(CallbackQueryHandler(confirm_send_ratings_callback, pattern=r"^confirm_rate:\d+$"))
-    app.add_handler(CallbackQueryHandler(handle_rating_callback, pattern=r"^rate:\d+:\d+$"))
-    app.add_handler(CallbackQueryHandler(view_ratings_callback, pattern=r"^view_ratings:\d+$"))
-    app.add_handler(CallbackQueryHandler(dismiss_rating_callback, pattern=r"^dismiss_rating:\d+$"))
+    # These two read ids from their own pattern's context.match, so they keep dedicated handlers
+    app.add_handler(CallbackQueryHandler(edit_party_info_callback, pattern=EDIT_INFO_PATTERN))
+    app.add_handler(CallbackQueryHandler(clear_info_callback, pattern=CLEAR_INFO_PATTERN))
+    app.add_handler(CallbackQueryHandler(_dispatch_callback, pattern=_is_plain_action))
 
     # --- Init DB on startup, close on shutdown ---
     async def post_init(application) -> None:
@@ -117,8 +216,20 @@ def main() -> None:
     app.post_init = post_init
     app.post_shutdown = post_shutdown
 
-    logger.info("Starting bot…")
-    app.run_polling(drop_pending_updates=True)
+    if WEBHOOK_URL:
+        # Telegram pushes updates; with block=False each one is acknowledged before its handler finishes
+        logger.info("Starting bot (webhook on port %d)…", PORT)
+        app.run_webhook(
+            listen="0.0.0.0",
+            port=PORT,
+            url_path=WEBHOOK_PATH,
+            webhook_url=f"{WEBHOOK_URL}/{WEBHOOK_PATH}",
+            secret_token=WEBHOOK_SECRET or None,
+            drop_pending_updates=True,
+        )
+    else:
+        logger.info("Starting bot (polling)…")
+        app.run_polling(drop_pending_updates=True)
 
 
 if __name__ == "__main__":
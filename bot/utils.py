@@ -1,26 +1,137 @@
 """Utility helpers."""
 
-import html
+import asyncio
+import logging
+import math
 import secrets
-import string
+import time
+from collections import Counter
+from datetime import timedelta
+
+from telegram.error import Forbidden, RetryAfter
+
+logger = logging.getLogger(__name__)
+
+# Max number of send_message calls in flight during a broadcast.
+# Actual pacing (25 msg/s overall) is done by the Application's AIORateLimiter.
+BROADCAST_CONCURRENCY = 25
+
+
+# Same replacements as html.escape(quote=True), done in one C-level pass
+_HTML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
 
 
 def esc(text: str) -> str:
     """Escape text for Telegram HTML parse mode."""
-    return html.escape(str(text))
+    return str(text).translate(_HTML_TRANS)
 
 
 def generate_party_code(length: int = 8) -> str:
-    """Generate a URL-safe random code for a party invite link."""
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    """Generate a URL-safe random code for a party invite link.
+
+    Uses the base64url alphabet (A-Z, a-z, 0-9, '-', '_'), which is exactly
+    what Telegram allows in a /start deep-link payload.
+    """
+    return secrets.token_urlsafe(math.ceil(length * 3 / 4))[:length]
+
+
+async def _send_one(bot, chat_id: int, **kwargs) -> str | None:
+    """Send one message. Returns None on success, otherwise a short failure reason."""
+    try:
+        await bot.send_message(chat_id=chat_id, **kwargs)
+        return None
+    except RetryAfter as e:
+        # The rate limiter already retried; wait out the flood control once more
+        delay = e.retry_after
+        await asyncio.sleep(delay.total_seconds() if isinstance(delay, timedelta) else delay)
+        try:
+            await bot.send_message(chat_id=chat_id, **kwargs)
+            return None
+        except Exception as retry_error:
+            return type(retry_error).__name__
+    except Forbidden:
+        return "blocked"
+    except Exception as e:
+        return type(e).__name__
+
+
+async def send_to_many(bot, chat_ids, **kwargs) -> tuple[int, int]:
+    """Send the same message to many chats concurrently. Returns (sent, failed)."""
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def _bounded_send(chat_id: int) -> str | None:
+        async with semaphore:
+            return await _send_one(bot, chat_id, **kwargs)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_bounded_send(chat_id)) for chat_id in chat_ids]
+    results = [task.result() for task in tasks]
+    failures = Counter(r for r in results if r is not None)
+    if failures:
+        logger.debug("Broadcast failures by reason: %s", dict(failures))
+    failed = sum(failures.values())
+    return len(results) - failed, failed
+
+
+# A repeated tap on the same invite link within this window reuses the last join result
+JOIN_MEMO_TTL = 30.0
+
+
+def recall_join(user_data: dict, code: str) -> dict | None:
+    """Return the party this user joined via `code` within the last JOIN_MEMO_TTL seconds."""
+    memo = user_data.get("_last_join")
+    if memo is None or memo[0] != code or time.monotonic() - memo[1] > JOIN_MEMO_TTL:
+        return None
+    return memo[2]
+
+
+def remember_join(user_data: dict, code: str, party: dict) -> None:
+    user_data["_last_join"] = (code, time.monotonic(), party)
+
+
+def forget_join(user_data: dict | None) -> None:
+    """Drop the join memo after the user leaves or is removed from a party, or it is cancelled."""
+    if user_data is not None:
+        user_data.pop("_last_join", None)
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage-collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _answer_quietly(query) -> None:
+    try:
+        await query.answer()
+    except Exception:
+        logger.debug("Could not answer callback query %s", query.id)
+
+
+def answer_in_background(query) -> None:
+    """Acknowledge a callback query without waiting for the round-trip."""
+    task = asyncio.create_task(_answer_quietly(query))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 def user_display_name(user) -> str:
     """Build a readable display name from a telegram User object."""
-    if user.username:
-        return f"@{user.username}"
-    full = user.first_name or ""
-    if user.last_name:
-        full += f" {user.last_name}"
-    return full.strip() or "Anonymous"
+    username = user.username
+    if username:
+        return f"@{username}"
+    first = user.first_name or ""
+    last = user.last_name
+    return (f"{first} {last}" if last else first).strip() or "Anonymous"
+
+
+async def edit_if_changed(query, text: str, reply_markup=None, parse_mode: str | None = None) -> None:
+    """Edit the query's message unless it already shows exactly this text and keyboard.
+
+    Telegram rejects a no-op edit with "message is not modified", so this
+    saves the round-trip when e.g. "Main menu" is tapped on the main menu.
+    """
+    message = query.message
+    current_text = getattr(message, "text", None)
+    if current_text is not None and message.reply_markup == reply_markup:
+        if (message.text_html if parse_mode == "HTML" else current_text) == text:
+            return
+    await query.edit_message_text(text, parse_mode=parse_mode, reply_markup=reply_markup)